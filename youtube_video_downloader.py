@@ -1,8 +1,61 @@
 import sys
 import os
+import re
+import copy
+import glob
+import json
+import time
+import hashlib
+import threading
+import collections
+import operator
 import subprocess
+from dataclasses import dataclass
 from PyQt6 import QtWidgets, QtCore, QtGui
-from yt_dlp import YoutubeDL
+
+INFO_CACHE_TTL = 600  # seconds a fetched info dict is reused for the same url
+# Stable yt-dlp cache dir so the parsed YouTube player JS survives between runs
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'yt2video')
+INFO_CACHE_DIR = os.path.join(CACHE_DIR, 'info')  # <sha1(url)>.json, valid for INFO_CACHE_TTL
+PROGRESS_PERCENT_INTERVAL = 0.1  # min seconds between progress bar updates sent to the GUI
+PROGRESS_TEXT_INTERVAL = 1.0  # min seconds between "Downloading..." status lines
+LOG_FLUSH_INTERVAL = 100  # ms between drains of the status message queue into the status box
+# Extensions treated as audio-only when a format reports no height
+AUDIO_EXTS = frozenset(['m4a', 'mp3', 'webm', 'opus', 'aac', 'mka'])
+# Options for the shared YoutubeDL that fetches video info
+INFO_YDL_OPTS = {
+    'quiet': True,
+    'skip_download': True,
+    'nocheckcertificate': True,
+    # Only the formats list is needed here, skip the extra requests
+    'writesubtitles': False,
+    'writeautomaticsub': False,
+    'listsubtitles': False,
+    'getcomments': False,
+    'check_formats': False,
+    'no_color': True,
+    'extract_flat': 'discard_in_playlist',
+    # Skip the extra client configs and the watch page; the client list stays yt-dlp's default,
+    # since pinning one client can leave anonymous users with only a 360p format.
+    # The DASH manifest duplicates the adaptive formats, so it is skipped. HLS is kept because
+    # for some default clients it is the only source of formats without a PO token.
+    'extractor_args': {'youtube': {'player_skip': ['configs', 'webpage'], 'skip': ['dash']}},
+    'cachedir': CACHE_DIR,
+}
+# [[HH:]MM:]SS, hours only allowed when minutes are present
+_HMS_RE = re.compile(r'^\s*(?:(?:(\d+):)?(\d+):)?(\d+)\s*$')
+
+
+@dataclass(slots=True)
+class FormatEntry:
+    """One selectable quality in the dropdown."""
+    format_id: str
+    type: str  # 'audio' or 'video'
+    ext: str
+    label: str
+    audio: bool  # whether the format carries an audio stream
+    height: int  # 0 for audio formats
+
 
 class RangeSlider(QtWidgets.QWidget):
     """
@@ -23,8 +76,24 @@ class RangeSlider(QtWidgets.QWidget):
         self.moving_end = False
         self.handle_radius = 10
         self.bar_height = 5
+        self._min_delta = 1  # smallest value step a drag reports, see _update_min_delta()
+        # Paint resources are built once and reused by every paintEvent
+        self._bar_brush = QtGui.QBrush(QtGui.QColor(200, 200, 200))
+        self._sel_brush = QtGui.QBrush(QtGui.QColor(100, 180, 255))
+        self._handle_brush = QtGui.QBrush(QtGui.QColor(50, 120, 215))
+        self._no_pen = QtGui.QPen(QtCore.Qt.PenStyle.NoPen)
+        # Coalesce drag updates to at most one repaint/emit per ~16 ms
+        self._pending_update = False
+        self._dirty_rect = QtCore.QRect()  # area touched by handle moves since the last flush
+        self._update_timer = QtCore.QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(16)
+        self._update_timer.timeout.connect(self._flush_update)
 
     def paintEvent(self, event):
+        # Too narrow to fit the bar between the handles, nothing sensible to draw
+        if self.width() < 2 * self.handle_radius:
+            return
         painter = QtGui.QPainter(self)
         rect = self.rect()
         # Draw background bar
@@ -34,8 +103,8 @@ class RangeSlider(QtWidgets.QWidget):
             rect.width() - 2 * self.handle_radius,
             self.bar_height
         )
-        painter.setPen(QtCore.Qt.PenStyle.NoPen)
-        painter.setBrush(QtGui.QColor(200, 200, 200))
+        painter.setPen(self._no_pen)
+        painter.setBrush(self._bar_brush)
         painter.drawRect(bar_rect)
 
         # Draw selection bar
@@ -47,12 +116,11 @@ class RangeSlider(QtWidgets.QWidget):
             end_x - start_x,
             self.bar_height
         )
-        painter.setBrush(QtGui.QColor(100, 180, 255))
+        painter.setBrush(self._sel_brush)
         painter.drawRect(selection_rect)
 
         # Draw handles
-        painter.setBrush(QtGui.QColor(50, 120, 215))
-        painter.setPen(QtCore.Qt.PenStyle.NoPen)
+        painter.setBrush(self._handle_brush)
         painter.drawEllipse(QtCore.QPoint(start_x, rect.center().y()), self.handle_radius, self.handle_radius)
         painter.drawEllipse(QtCore.QPoint(end_x, rect.center().y()), self.handle_radius, self.handle_radius)
 
@@ -89,24 +157,61 @@ class RangeSlider(QtWidgets.QWidget):
                 val = self.min_val
             if val > self.end_pos:
                 val = self.end_pos
-            if val != self.start_pos:
+            # Ignore sub-pixel jitter, but always let the handle reach its limits
+            if val != self.start_pos and (abs(val - self.start_pos) >= self._min_delta or val in (self.min_val, self.end_pos)):
+                self._mark_dirty(self.start_pos, val)
                 self.start_pos = val
-                self.valueChanged.emit(self.start_pos, self.end_pos)
-                self.update()
+                self._schedule_update()
         elif self.moving_end:
             val = self.pos_to_value(x)
             if val > self.max_val:
                 val = self.max_val
             if val < self.start_pos:
                 val = self.start_pos
-            if val != self.end_pos:
+            if val != self.end_pos and (abs(val - self.end_pos) >= self._min_delta or val in (self.start_pos, self.max_val)):
+                self._mark_dirty(self.end_pos, val)
                 self.end_pos = val
-                self.valueChanged.emit(self.start_pos, self.end_pos)
-                self.update()
+                self._schedule_update()
 
     def mouseReleaseEvent(self, event):
         self.moving_start = False
         self.moving_end = False
+        # Deliver the final position right away instead of waiting for the timer
+        if self._pending_update:
+            self._update_timer.stop()
+            self._flush_update()
+
+    def resizeEvent(self, event):
+        self._update_min_delta()
+        super().resizeEvent(event)
+
+    def _update_min_delta(self):
+        """Recompute how much value one pixel of track is worth, so drags move in pixel-sized steps."""
+        width = self.width() - 2 * self.handle_radius
+        self._min_delta = max(1, (self.max_val - self.min_val) // width) if width > 0 else 1
+
+    def _mark_dirty(self, old_val, new_val):
+        """Add the strip swept by a handle moving from old_val to new_val to the dirty rect."""
+        # The strip also covers the part of the selection bar that changed
+        old_x = self.value_to_pos(old_val)
+        new_x = self.value_to_pos(new_val)
+        r = self.handle_radius
+        swept = QtCore.QRect(min(old_x, new_x) - r, 0, abs(new_x - old_x) + 2 * r + 1, self.height())
+        self._dirty_rect = self._dirty_rect.united(swept)
+
+    def _schedule_update(self):
+        self._pending_update = True
+        if not self._update_timer.isActive():
+            self._update_timer.start()
+
+    def _flush_update(self):
+        """Emit valueChanged and repaint once for all moves since the last flush."""
+        if not self._pending_update:
+            return
+        self._pending_update = False
+        self.valueChanged.emit(self.start_pos, self.end_pos)
+        self.update(self._dirty_rect)
+        self._dirty_rect = QtCore.QRect()
 
     def setRange(self, min_val, max_val):
         self.min_val = min_val
@@ -115,6 +220,7 @@ class RangeSlider(QtWidgets.QWidget):
             self.start_pos = min_val
         if self.end_pos > max_val or self.end_pos < min_val:
             self.end_pos = max_val
+        self._update_min_delta()
         self.update()
 
     def setValues(self, start, end):
@@ -134,96 +240,185 @@ class RangeSlider(QtWidgets.QWidget):
 
 
 def seconds_to_hms(seconds):
-    seconds = int(seconds)
-    h = seconds // 3600
-    m = (seconds % 3600) // 60
-    s = seconds % 60
-    if h > 0:
-        return f"{h}:{m:02d}:{s:02d}"
-    else:
-        return f"{m}:{s:02d}"
+    m, s = divmod(int(seconds), 60)
+    h, m = divmod(m, 60)
+    return f"{h}:{m:02d}:{s:02d}" if h else f"{m}:{s:02d}"
 
 def hms_to_seconds(time_str):
-    parts = time_str.strip().split(':')
-    try:
-        parts = [int(p) for p in parts]
-    except:
-        return None
-    if len(parts) == 3:
-        return parts[0]*3600 + parts[1]*60 + parts[2]
-    elif len(parts) == 2:
-        return parts[0]*60 + parts[1]
-    elif len(parts) == 1:
-        return parts[0]
-    else:
+    m = _HMS_RE.match(time_str)
+    if not m:
         return None
+    h, m_, s = m.groups()
+    return int(h or 0)*3600 + int(m_ or 0)*60 + int(s)
 
+def prune_info_cache():
+    """Delete cached info files older than INFO_CACHE_TTL, including ones for urls never fetched again."""
+    now = time.time()
+    try:
+        entries = list(os.scandir(INFO_CACHE_DIR))
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            if now - entry.stat().st_mtime >= INFO_CACHE_TTL:
+                os.remove(entry.path)
+        except OSError:
+            pass
 
-class WorkerFetchInfo(QtCore.QThread):
+
+class WorkerFetchSignals(QtCore.QObject):
     fetched = QtCore.pyqtSignal(object)  # emits video_info dict or None on error
     error = QtCore.pyqtSignal(str)
+    finished = QtCore.pyqtSignal()
+
 
-    def __init__(self, url):
+class WorkerFetchInfo(QtCore.QRunnable):
+    def __init__(self, url, get_ydl):
+        """
+        get_ydl: callable returning the app's shared YoutubeDL, called from the worker thread
+        """
         super().__init__()
         self.url = url
+        self.get_ydl = get_ydl
+        self.signals = WorkerFetchSignals()
+        self.cache_file = os.path.join(INFO_CACHE_DIR, hashlib.sha1(url.encode('utf-8')).hexdigest() + '.json')
+
+    def load_cached_info(self):
+        """Return the info saved for this url by an earlier fetch, or None if missing/stale."""
+        try:
+            if time.time() - os.path.getmtime(self.cache_file) >= INFO_CACHE_TTL:
+                os.remove(self.cache_file)
+                return None
+            with open(self.cache_file, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def save_cached_info(self, info):
+        # Written under a temp name first so a crash never leaves a truncated cache file
+        tmp_file = self.cache_file + '.tmp'
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(info, f)
+            os.replace(tmp_file, self.cache_file)
+        except OSError:
+            pass
 
     def run(self):
-        ydl_opts = {
-            'quiet': True,
-            'skip_download': True,
-            'nocheckcertificate': True,
-        }
         try:
-            with YoutubeDL(ydl_opts) as ydl:
+            info = self.load_cached_info()
+            if info is None:
+                ydl = self.get_ydl()
+                # Processing is kept: it gives formats the same sanitized, de-duplicated format_ids
+                # the download selects by, and with check_formats off it makes no extra requests
                 info = ydl.extract_info(self.url, download=False)
-                self.fetched.emit(info)
+                # sanitize_info makes the dict JSON-safe, so fresh and cached results look the same
+                info = ydl.sanitize_info(info)
+                if info.get('_type', 'video') == 'video':
+                    self.save_cached_info(info)
+            self.signals.fetched.emit(info)
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.error.emit(str(e))
+        finally:
+            self.signals.finished.emit()
 
 
-class WorkerDownload(QtCore.QThread):
+class WorkerDownloadSignals(QtCore.QObject):
     progress_percent = QtCore.pyqtSignal(int)  # emits percent int 0-100
-    progress_text = QtCore.pyqtSignal(str)  # emits status string updates
     finished = QtCore.pyqtSignal(str)  # emits final saved filename or error message
 
-    def __init__(self, url, format_selector, selected_meta, ffmpeg_path, start_time, end_time, outtmpl):
+
+class WorkerDownload(QtCore.QRunnable):
+    def __init__(self, url, format_selector, selected_meta, ffmpeg_path, start_time, end_time, outtmpl, log_queue, info_dict=None):
         """
-        selected_meta: dictionary describing chosen format (type: 'audio'|'video', ext, format_id, audio flag)
+        log_queue: the app's status message deque; status strings are appended to it
+                   (atomic in CPython) instead of being sent through a queued signal
+        selected_meta: FormatEntry describing chosen format (type: 'audio'|'video', ext, format_id, audio flag)
         format_selector: string to pass to yt-dlp (format id or combo)
+        info_dict: info dict already fetched for this url, reused so yt-dlp doesn't extract it again
         """
         super().__init__()
+        self.signals = WorkerDownloadSignals()
         self.url = url
+        self.info_dict = info_dict
         self.format_selector = format_selector
         self.selected_meta = selected_meta
         self.ffmpeg_path = ffmpeg_path
         self.start_time = start_time
         self.end_time = end_time
         self.outtmpl = outtmpl
+        self.log_queue = log_queue
+        self._last_emit = 0.0
+        self._last_pct = -1
+        self._last_text_emit = 0.0
 
     def ydl_hook(self, d):
         if d.get('status') == 'downloading':
+            # yt-dlp calls this many times a second, only forward a few of them
+            now = time.monotonic()
+            if now - self._last_emit < PROGRESS_PERCENT_INTERVAL:
+                return
+            self._last_emit = now
             percent_raw = d.get('_percent_str', '0.0%').strip()
             try:
                 percent = float(percent_raw.strip('%'))
-            except:
+            except ValueError:
                 percent = 0
-            self.progress_percent.emit(int(percent))
-            speed = d.get('_speed_str', '').strip()
-            eta = d.get('_eta_str', '').strip()
-            self.progress_text.emit(f"Downloading... {percent_raw} at {speed}, ETA: {eta}")
+            # The bar only needs a signal when the whole-number percent moves
+            if int(percent) != self._last_pct:
+                self._last_pct = int(percent)
+                self.signals.progress_percent.emit(self._last_pct)
+            if now - self._last_text_emit >= PROGRESS_TEXT_INTERVAL:
+                self._last_text_emit = now
+                speed = d.get('_speed_str', '').strip()
+                eta = d.get('_eta_str', '').strip()
+                self.log_queue.append(f"Downloading... {percent_raw} at {speed}, ETA: {eta}")
         elif d.get('status') == 'finished':
-            self.progress_percent.emit(100)
-            self.progress_text.emit("Download finished, processing...")
+            self._last_pct = 100
+            self.signals.progress_percent.emit(100)
+            self.log_queue.append("Download finished, processing...")
 
-    def run_ffmpeg(self, cmd):
-        """Run ffmpeg command and return (returncode, stdout, stderr)."""
+    def run_ffmpeg(self, cmd, duration=None):
+        """
+        Run ffmpeg command and return (returncode, stdout, stderr).
+        stdout is not kept (ffmpeg writes its output to files), so it is always ''.
+        If duration (seconds of output) is given, progress is read from ffmpeg's
+        -progress stream and emitted as progress_percent while it runs.
+        """
+        if duration:
+            cmd = cmd[:1] + ['-progress', 'pipe:1', '-nostats'] + cmd[1:]
         try:
-            proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            return proc.returncode, proc.stdout.decode(errors='ignore'), proc.stderr.decode(errors='ignore')
+            proc = subprocess.Popen(
+                cmd,
+                # With progress, stderr shares the stdout pipe so a burst of errors can't fill an
+                # unread stderr pipe and block ffmpeg while we wait on stdout
+                stdout=subprocess.PIPE if duration else subprocess.DEVNULL,
+                stderr=subprocess.STDOUT if duration else subprocess.PIPE,
+                text=True, errors='ignore', bufsize=1,
+                # No console window flashing up per ffmpeg run on Windows (0 elsewhere)
+                creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0),
+            )
+            if not duration:
+                _, err = proc.communicate()
+                return proc.returncode, '', err
+            err_lines = []
+            for line in proc.stdout:
+                key, sep, value = line.strip().partition('=')
+                if not (sep and key.isidentifier()):
+                    # Not a -progress key=value pair, so it is an error message
+                    err_lines.append(line)
+                # out_time_ms is in microseconds despite its name
+                elif key == 'out_time_ms' and value.isdigit():
+                    self.signals.progress_percent.emit(min(100, int(100 * int(value) / (duration * 1e6))))
+            proc.wait()
+            return proc.returncode, '', ''.join(err_lines)
         except Exception as e:
             return 1, '', str(e)
 
     def run(self):
+        # download_video passes None for both when the whole video is wanted
+        needs_trim = self.start_time is not None or self.end_time is not None
+
         # Prepare yt-dlp options
         ydl_opts = {
             'format': self.format_selector,
@@ -233,120 +428,99 @@ class WorkerDownload(QtCore.QThread):
             'quiet': True,
             'no_warnings': True,
             'merge_output_format': 'mp4',  # used if merging video+audio
+            'cachedir': CACHE_DIR,
+            # Fetch DASH/HLS fragments over several connections, and plain https streams in
+            # 10 MiB ranges so one throttled request doesn't stall the whole download
+            'concurrent_fragment_downloads': 8,
+            'http_chunk_size': 10 * 1024 * 1024,
         }
         try:
+            from yt_dlp import YoutubeDL
+            from yt_dlp.utils import download_range_func
+            if needs_trim:
+                # Only download the requested section instead of the whole video plus an ffmpeg trim
+                end = self.end_time if self.end_time is not None else float('inf')
+                ydl_opts['download_ranges'] = download_range_func(None, [(self.start_time or 0, end)])
+                if self.selected_meta.type == 'video':
+                    # Exact cuts make yt-dlp re-encode the section; audio skips that here because
+                    # it is encoded once anyway by the mp3 conversion below
+                    ydl_opts['force_keyframes_at_cuts'] = True
             with YoutubeDL(ydl_opts) as ydl:
-                # Download according to selected format
-                ydl.download([self.url])
-                info_dict = ydl.extract_info(self.url, download=False)
-                downloaded_filename = ydl.prepare_filename(info_dict)
-                # If yt-dlp merged to mp4 it may already have mp4 extension; ensure we pick file that exists
+                # Download according to selected format, reusing the fetched info when we have it
+                if self.info_dict is not None:
+                    info_dict = ydl.process_ie_result(copy.deepcopy(self.info_dict), download=True)
+                else:
+                    info_dict = ydl.extract_info(self.url, download=True)
+                # yt-dlp records the final path of each download (after merging) in requested_downloads
+                requested = info_dict.get('requested_downloads') or [{}]
+                downloaded_filename = requested[-1].get('filepath') or ydl.prepare_filename(info_dict)
+                # Only prepare_filename's guess can miss (e.g. a different merged extension);
+                # match the same base name with any extension instead of scanning the whole folder
                 if not os.path.exists(downloaded_filename):
-                    # try common extensions
                     base = os.path.splitext(downloaded_filename)[0]
-                    for ext in (self.selected_meta.get('ext') or '').split(',') + ['mp4','m4a','webm','mp3','mkv','m4v','aac','opus']:
-                        candidate = f"{base}.{ext}"
-                        if os.path.exists(candidate):
+                    for candidate in glob.glob(glob.escape(base) + '.*'):
+                        if not candidate.endswith(('.part', '.ytdl')):
                             downloaded_filename = candidate
                             break
-                    else:
-                        # fallback: choose any file that matches the base
-                        dir_files = os.listdir(os.path.dirname(self.outtmpl) or '.')
-                        for fn in dir_files:
-                            if fn.startswith(os.path.basename(base)):
-                                downloaded_filename = os.path.join(os.path.dirname(self.outtmpl) or '.', fn)
-                                break
 
             # At this point downloaded_filename should point to the downloaded file
             if not os.path.exists(downloaded_filename):
-                self.finished.emit(f"Error: downloaded file not found: {downloaded_filename}")
+                self.signals.finished.emit(f"Error: downloaded file not found: {downloaded_filename}")
                 return
 
-            # If no trimming requested and chosen type is video and no post-processing necessary, optionally convert audio etc.
-            # Trimming logic (if requested):
-            trimmed_filename = None
-            if self.start_time is not None or self.end_time is not None:
-                # If both None nothing to do; else compute
-                ss = str(self.start_time or 0)
-                if self.end_time is not None:
-                    duration = self.end_time - (self.start_time or 0)
-                    t_arg = str(duration)
-                else:
-                    t_arg = None
-
-                # Build trimmed filename
-                base, ext = os.path.splitext(downloaded_filename)
-                trimmed_filename = f"{base}_trimmed{ext}"
-
-                # Try lossless stream copy first (fast and lossless) using -c copy
-                cmd = [self.ffmpeg_path, '-hide_banner', '-loglevel', 'error']
-                if self.start_time:
-                    cmd += ['-ss', ss]
-                if t_arg:
-                    cmd += ['-t', t_arg]
-                cmd += ['-i', downloaded_filename, '-c', 'copy', trimmed_filename]
-                self.progress_text.emit(f"Trimming (stream-copy) from {ss} length {t_arg or 'until end'} ...")
-                rc, out, err = self.run_ffmpeg(cmd)
-                if rc != 0:
-                    # fallback: re-encode (still functional)
-                    self.progress_text.emit("Stream-copy trimming failed, falling back to re-encode trimming...")
-                    cmd = [self.ffmpeg_path, '-hide_banner', '-loglevel', 'error']
-                    if self.start_time:
-                        cmd += ['-ss', ss]
-                    if t_arg:
-                        cmd += ['-t', t_arg]
-                    cmd += ['-i', downloaded_filename, '-c:a', 'aac', '-c:v', 'libx264', '-strict', '-2', trimmed_filename]
-                    rc2, out2, err2 = self.run_ffmpeg(cmd)
-                    if rc2 != 0:
-                        self.finished.emit(f"FFmpeg trimming error: {err2 or err}")
-                        return
-                # If stream-copy succeeded or re-encode succeeded, optionally remove the original
-                try:
-                    os.remove(downloaded_filename)
-                except Exception:
-                    pass
-                working_file = trimmed_filename
-            else:
-                working_file = downloaded_filename
+            working_file = downloaded_filename
+            working_duration = info_dict.get('duration')
+            if needs_trim:
+                # Only the requested section was downloaded
+                section_end = self.end_time if self.end_time is not None else working_duration or 0
+                working_duration = max(0, section_end - (self.start_time or 0))
 
             final_output = working_file
 
             # If user selected an audio format, convert to mp3 per your choice
-            if self.selected_meta.get('type') == 'audio':
-                # target mp3 filename
+            if self.selected_meta.type == 'audio':
+                # target mp3 filename; ffmpeg writes a temp file next to it that is renamed into place,
+                # so a failed or interrupted conversion never leaves a truncated mp3 behind
                 base, _ = os.path.splitext(working_file)
                 mp3_filename = base + '.mp3'
+                part_filename = base + '.part.mp3'
                 # Convert to mp3 (re-encode) at reasonable bitrate
-                self.progress_text.emit("Converting to MP3...")
+                self.log_queue.append("Converting to MP3...")
                 cmd = [
                     self.ffmpeg_path,
                     '-hide_banner', '-loglevel', 'error',
+                    '-y',  # the temp path is ours, overwrite a leftover from an earlier crash
                     '-i', working_file,
                     '-vn',  # no video
                     '-ab', '192k',
                     '-ar', '44100',
-                    mp3_filename
+                    part_filename
                 ]
-                rc, out, err = self.run_ffmpeg(cmd)
+                rc, out, err = self.run_ffmpeg(cmd, working_duration)
                 if rc != 0:
-                    self.finished.emit(f"FFmpeg conversion to mp3 failed: {err}")
+                    # Don't leave the half-written temp file in the user's folder
+                    try:
+                        os.remove(part_filename)
+                    except OSError:
+                        pass
+                    self.signals.finished.emit(f"FFmpeg conversion to mp3 failed: {err}")
                     return
+                os.replace(part_filename, mp3_filename)
                 # Remove intermediate working file if different
-                if os.path.exists(mp3_filename):
+                if working_file != mp3_filename:
                     try:
-                        if working_file != mp3_filename:
-                            os.remove(working_file)
-                    except Exception:
+                        os.remove(working_file)
+                    except OSError:
                         pass
-                    final_output = mp3_filename
+                final_output = mp3_filename
 
             # If user picked a video format that was audio-less and we asked yt-dlp to combine, that was done by yt-dlp.
 
             # Done
-            self.finished.emit(final_output)
+            self.signals.finished.emit(final_output)
 
         except Exception as e:
-            self.finished.emit(f"Error: {str(e)}")
+            self.signals.finished.emit(f"Error: {str(e)}")
 
 
 class YouTubeDownloaderApp(QtWidgets.QWidget):
@@ -360,7 +534,12 @@ class YouTubeDownloaderApp(QtWidgets.QWidget):
             self.ffmpeg_path = possible_ffmpeg
         else:
             self.ffmpeg_path = 'ffmpeg'  # assume in PATH
+        os.makedirs(INFO_CACHE_DIR, exist_ok=True)
+        prune_info_cache()
         self.video_info = None
+        self._info_cache = {}  # url -> (fetch time, info dict)
+        self._ydl_info = None  # shared YoutubeDL for info fetches, see info_ydl()
+        self._ydl_info_lock = threading.Lock()
         self.formats = []
         self.duration = 0  # in seconds
         self.init_ui()
@@ -410,9 +589,16 @@ class YouTubeDownloaderApp(QtWidgets.QWidget):
         self.download_button.setEnabled(False)
         self.download_button.clicked.connect(self.download_video)
 
-        self.status_box = QtWidgets.QTextEdit()
+        # Plain text is cheaper to lay out than rich text, and log() appends in batches
+        self.status_box = QtWidgets.QPlainTextEdit()
         self.status_box.setReadOnly(True)
         self.status_box.setMaximumHeight(180)
+        # Filled by log() and directly by download workers, drained on the GUI thread by _flush_log
+        self._log_queue = collections.deque()
+        self._log_timer = QtCore.QTimer(self)
+        self._log_timer.setInterval(LOG_FLUSH_INTERVAL)
+        self._log_timer.timeout.connect(self._flush_log)
+        self._log_timer.start()
 
         layout.addWidget(url_label)
         layout.addWidget(self.url_input)
@@ -427,99 +613,102 @@ class YouTubeDownloaderApp(QtWidgets.QWidget):
         self.setLayout(layout)
 
     def log(self, message):
-        self.status_box.append(message)
-        self.status_box.ensureCursorVisible()
-        QtCore.QCoreApplication.processEvents()
+        # Messages are queued and written together by _flush_log, one layout pass per batch
+        self._log_queue.append(message)
+
+    def _flush_log(self):
+        batch = []
+        while self._log_queue:
+            batch.append(self._log_queue.popleft())
+        if not batch:
+            return
+        self.status_box.appendPlainText('\n'.join(batch))
+        scrollbar = self.status_box.verticalScrollBar()
+        scrollbar.setValue(scrollbar.maximum())
+
+    def info_ydl(self):
+        """
+        Return the YoutubeDL shared by all info fetches, so its HTTP connections
+        and TLS sessions are reused. Created on first use from a worker thread.
+        """
+        with self._ydl_info_lock:
+            if self._ydl_info is None:
+                # yt-dlp is imported on first use so its extractors don't delay the window appearing
+                from yt_dlp import YoutubeDL
+                self._ydl_info = YoutubeDL(dict(INFO_YDL_OPTS))
+            return self._ydl_info
 
     def fetch_qualities(self):
         url = self.url_input.text().strip()
         if not url:
             self.log("Please enter a YouTube URL.")
             return
+        cached = self._info_cache.get(url)
+        if cached is not None:
+            if time.monotonic() - cached[0] < INFO_CACHE_TTL:
+                self.log("Using cached video information.")
+                self.on_info_fetched(cached[1])
+                return
+            del self._info_cache[url]
         self.fetch_button.setEnabled(False)
         self.download_button.setEnabled(False)
         self.progress_bar.setVisible(True)
         self.progress_bar.setRange(0, 0)  # Indeterminate progress while fetching info
         self.progress_bar.setValue(0)
         self.log("Fetching video information...")
-        self.worker_fetch = WorkerFetchInfo(url)
-        self.worker_fetch.fetched.connect(self.on_info_fetched)
-        self.worker_fetch.error.connect(self.on_fetch_error)
-        self.worker_fetch.finished.connect(self.on_fetch_finished)
-        self.worker_fetch.start()
+        # The fetch button stays disabled until a fetch finishes, so the shared ydl is never used concurrently
+        worker = WorkerFetchInfo(url, self.info_ydl)
+        worker.signals.fetched.connect(self.on_info_fetched)
+        worker.signals.error.connect(self.on_fetch_error)
+        worker.signals.finished.connect(self.on_fetch_finished)
+        # Keep the signals object alive; the pool owns the runnable itself
+        self.fetch_signals = worker.signals
+        QtCore.QThreadPool.globalInstance().start(worker)
 
     def on_info_fetched(self, info):
         self.video_info = info
+        url = info.get('original_url')
+        if url and url not in self._info_cache:
+            # Stamp with when the info was extracted (sanitize_info sets 'epoch'), not now, so
+            # info loaded from the disk cache doesn't get a second full TTL in memory
+            age = max(0, time.time() - info.get('epoch', time.time()))
+            self._info_cache[url] = (time.monotonic() - age, info)
         self.duration = int(info.get('duration', 0))
         formats = info.get('formats', [])
 
-        # We'll include audio formats (vcodec == 'none' or acodec != 'none' and no height)
-        audio_exts = set(['m4a', 'mp3', 'webm', 'opus', 'aac', 'mka'])
-        video_exts = set(['mp4', 'webm', 'mkv', 'm4v'])
-
-        fmt_map = {}  # key by label for uniqueness
-        collected = []
+        seen = set()  # format_ids already added, keeping the first occurrence
+        entries = []
 
         for f in formats:
-            fid = f.get('format_id')
-            ext = (f.get('ext') or '').lower()
-            vcodec = f.get('vcodec', 'none')
-            acodec = f.get('acodec', 'none')
-            height = f.get('height')
-            # Determine type
-            if vcodec == 'none' or (ext in audio_exts and height is None):
+            get = f.get
+            fid = get('format_id')
+            if fid in seen:
+                continue
+            seen.add(fid)
+            vcodec = get('vcodec', 'none')
+            acodec = get('acodec', 'none')
+            ext = (get('ext') or '').lower()
+            height = get('height')
+            # Determine type (audio: vcodec == 'none', or a known audio ext with no height)
+            if vcodec == 'none' or (ext in AUDIO_EXTS and height is None):
                 # audio format
-                abr = f.get('abr') or f.get('tbr') or ''
+                abr = get('abr') or get('tbr') or ''
                 label = f"{ext} {abr}kbps - audio" if abr else f"{ext} - audio"
-                meta = {
-                    'format_id': fid,
-                    'type': 'audio',
-                    'ext': ext,
-                    'label': label,
-                    'audio': True
-                }
-                # Add only unique format_id
-                collected.append(meta)
+                entries.append(FormatEntry(fid, 'audio', ext, label, True, 0))
             else:
                 # video format
-                res = f.get('format_note') or f.get('resolution') or (str(f.get('height')) + 'p' if f.get('height') else '')
+                res = get('format_note') or get('resolution') or (f"{height}p" if height else '')
                 audio_present = (acodec != 'none')
                 label = f"{res} - video" if res else f"{ext} - video"
-                meta = {
-                    'format_id': fid,
-                    'type': 'video',
-                    'ext': ext,
-                    'label': label,
-                    'audio': audio_present
-                }
-                collected.append(meta)
-
-        # Remove duplicates (by format_id) keeping first occurrence
-        unique = {}
-        deduped = []
-        for m in collected:
-            if m['format_id'] not in unique:
-                unique[m['format_id']] = True
-                deduped.append(m)
+                entries.append(FormatEntry(fid, 'video', ext, label, audio_present, height or 0))
 
         # Sort: prefer higher resolution videos first, then audio (no strict ordering)
-        def sort_key(m):
-            if m['type'] == 'video':
-                # extract digits from label for resolution
-                import re
-                digits = re.findall(r'(\d{2,4})p', m['label'])
-                if digits:
-                    return (-int(digits[0]), 0)
-                else:
-                    return (0, 0)
-            else:
-                return (9999, 1)
-        deduped_sorted = sorted(deduped, key=sort_key)
+        # ('video', height) > ('audio', 0), so reverse order puts the tallest videos first
+        entries.sort(key=operator.attrgetter('type', 'height'), reverse=True)
 
-        self.formats = deduped_sorted
+        self.formats = entries
         self.quality_dropdown.clear()
-        for fmt in self.formats:
-            self.quality_dropdown.addItem(fmt['label'])
+        self.quality_dropdown.addItems([fmt.label for fmt in self.formats])
 
         if not self.formats:
             self.log("No formats found.")
@@ -593,12 +782,12 @@ class YouTubeDownloaderApp(QtWidgets.QWidget):
         if start_time is None or end_time is None:
             self.log("Invalid start or end time format.")
             return
-        if start_time < 0 or end_time < 0:
-            self.log("Start or end time cannot be negative.")
-            return
         if end_time <= start_time:
             self.log("End time must be greater than start time.")
             return
+        if start_time == 0 and self.duration > 0 and end_time >= self.duration:
+            # Untouched slider: download the whole video, no section download or trimming
+            start_time = end_time = None
         self.download_button.setEnabled(False)
         self.fetch_button.setEnabled(False)
         self.progress_bar.setVisible(True)
@@ -607,7 +796,7 @@ class YouTubeDownloaderApp(QtWidgets.QWidget):
         self.log("Starting download...")
 
         selected_meta = self.formats[selected_index]
-        format_id = selected_meta['format_id']
+        format_id = selected_meta.format_id
 
         downloads_path = os.path.join(os.path.expanduser("~"), "Downloads")
         if not os.path.isdir(downloads_path):
@@ -616,8 +805,8 @@ class YouTubeDownloaderApp(QtWidgets.QWidget):
 
         # Build format selector:
         # If video selected and it has no audio, ask yt-dlp to merge with bestaudio
-        if selected_meta['type'] == 'video':
-            if not selected_meta.get('audio', False):
+        if selected_meta.type == 'video':
+            if not selected_meta.audio:
                 format_selector = f"{format_id}+bestaudio/best"
             else:
                 format_selector = format_id
@@ -625,13 +814,19 @@ class YouTubeDownloaderApp(QtWidgets.QWidget):
             # audio selected
             format_selector = format_id
 
-        self.worker_download = WorkerDownload(
-            url, format_selector, selected_meta, self.ffmpeg_path, start_time, end_time, outtmpl
+        # Only reuse the fetched info if it belongs to the url being downloaded
+        info_dict = None
+        if self.video_info and self.video_info.get('original_url') == url:
+            info_dict = self.video_info
+
+        worker = WorkerDownload(
+            url, format_selector, selected_meta, self.ffmpeg_path, start_time, end_time, outtmpl,
+            self._log_queue, info_dict
         )
-        self.worker_download.progress_percent.connect(self.progress_bar.setValue)
-        self.worker_download.progress_text.connect(self.log)
-        self.worker_download.finished.connect(self.on_download_finished)
-        self.worker_download.start()
+        worker.signals.progress_percent.connect(self.progress_bar.setValue)
+        worker.signals.finished.connect(self.on_download_finished)
+        self.download_signals = worker.signals
+        QtCore.QThreadPool.globalInstance().start(worker)
 
     def on_download_finished(self, result):
         self.log(f"Finished: {result}")
@@ -639,6 +834,11 @@ class YouTubeDownloaderApp(QtWidgets.QWidget):
         self.fetch_button.setEnabled(True)
         self.progress_bar.setVisible(False)
 
+    def closeEvent(self, event):
+        if self._ydl_info is not None:
+            self._ydl_info.close()
+        super().closeEvent(event)
+
 
 def main():
     app = QtWidgets.QApplication(sys.argv)